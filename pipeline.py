@@ -0,0 +1,171 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+import io
+import re
+
+_COL_CLEAN_RE = re.compile(r'[^\w\s]')
+# Date-like prefixes: 2020-01-05, 5/1/2020, 05.01.2020, Jan 5, 2020, 5 Jan 2020
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_DATE_RE = re.compile(
+    r'^(?:\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}'
+    rf'|\d{{1,2}}\s+{_MONTH},?\s+\d{{2,4}}'
+    rf'|{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{2,4}})',
+    re.IGNORECASE,
+)
+
+# Only a few recent uploads are kept; each entry holds pickled frames
+_CACHE_ENTRIES = 4
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES)
+def load_csv(bytes_data):
+    # The upload is already in memory and pyarrow pulls it in 1 MiB blocks,
+    # so a BufferedReader would only add a copy on top of BytesIO.
+    df = pd.read_csv(io.BytesIO(bytes_data), encoding='latin1', engine='pyarrow')
+    if df.columns.duplicated().any() or (df.columns == '').any():
+        # pyarrow keeps repeated and blank headers as-is; the C engine names
+        # them a, a.1, ... and Unnamed: 0, which every later stage relies on
+        return pd.read_csv(io.BytesIO(bytes_data), encoding='latin1')
+    for col in df.select_dtypes(include='object'):
+        first = df[col].first_valid_index()
+        if first is not None and type(df.at[first, col]) is datetime.date:
+            # pyarrow turns ISO dates into datetime.date objects; keep them as
+            # the strings the C engine returns so nulls and Parquet behave
+            df[col] = df[col].astype(str).where(df[col].notna())
+    return df
+
+def clean_column_names(df):
+    return [_COL_CLEAN_RE.sub('', col.strip().lower().replace(' ', '_')) for col in df.columns]
+
+def downcast_numeric(df):
+    # Keep float64 where float32 would lose digits
+    df = df.copy()
+    for col in df.select_dtypes(include='integer'):
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include='float'):
+        downcast = pd.to_numeric(df[col], downcast='float')
+        if downcast.astype(df[col].dtype).equals(df[col]):
+            df[col] = downcast
+    return df
+
+def handle_nulls(df):
+    null_counts = df.isna().sum()
+    cols_with_null = df[null_counts.index[null_counts > 0]]
+    if not cols_with_null.empty:
+        fill_values = cols_with_null.select_dtypes(exclude='object').median().to_dict()
+        fill_values.update({col: "unknown" for col in cols_with_null.select_dtypes(include='object')})
+        df = df.fillna(fill_values)
+    return df, int(null_counts.sum())
+
+def dedupe(df):
+    deduped = df.drop_duplicates(ignore_index=True)
+    return deduped, len(df) - len(deduped)
+
+def drop_constant(df):
+    # Numeric columns are constant when min == max (no hash-set build needed)
+    num_df = df.select_dtypes(include='number')
+    num_const = num_df.columns[(num_df.min() == num_df.max()) | num_df.isna().all()]
+    unique_counts = df.select_dtypes(exclude='number').nunique(dropna=False)
+    other_const = unique_counts.index[unique_counts <= 1]
+    const_cols = [col for col in df.columns if col in num_const or col in other_const]
+    return df.drop(columns=const_cols), const_cols
+
+def detect_outliers(df):
+    # One numeric block feeds both the z-score mask and the correlation
+    num_cols = df.select_dtypes(include='number').columns
+    X = df[num_cols].to_numpy(dtype=np.float32)
+
+    # |x - mean| > 3·std, accumulated column by column into one row mask
+    # NumPy's pairwise summation stays accurate on float32; a single
+    # running float32 total (as in bottleneck) drifts badly on large uploads
+    mu = np.nanmean(X, axis=0)
+    sd = np.nanstd(X, axis=0)
+    sd[sd == 0] = 1
+    outliers = np.zeros(X.shape[0], dtype=bool)
+    for j in range(X.shape[1]):
+        np.logical_or(outliers, np.abs(X[:, j] - mu[j]) > 3 * sd[j], out=outliers)
+
+    # Correlation for the heatmap from the kept rows; nulls are filled by
+    # now, so corrcoef's single float32 GEMM replaces pandas' pairwise loop
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.corrcoef(X[~outliers], rowvar=False, dtype=np.float32)
+    corr = pd.DataFrame(np.atleast_2d(corr), index=num_cols, columns=num_cols)
+    return df[~outliers], int(outliers.sum()), corr
+
+def infer_dtypes(df):
+    df = df.copy()
+    correction_log = []
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            try:
+                df[col] = pd.to_numeric(df[col])
+                correction_log.append((col, "object", "numeric"))
+                continue
+            except:
+                pass
+            # Only attempt datetime parsing when a sample looks date-like
+            sample = df[col].dropna().head(20).astype(str)
+            if len(sample) and sample.str.match(_DATE_RE).mean() > 0.8:
+                try:
+                    df[col] = pd.to_datetime(df[col])
+                    correction_log.append((col, "object", "datetime"))
+                except:
+                    pass
+    return df, correction_log
+
+def standardize_categorical(df):
+    df = df.copy()
+    summary = []
+
+    for col in df.select_dtypes(include='object'):
+        # String cleanup runs on the k unique values, then maps back via codes
+        codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+        if uniques.notna().sum() < 50:  # only for small cardinality
+            original_vals = uniques.tolist()
+            cleaned = pd.Series(uniques.astype(str)).str.strip().str.lower()
+
+            # Gender Example
+            if 'gender' in col:
+                cleaned = cleaned.replace({
+                    'm': 'male', 'male': 'male',
+                    'f': 'female', 'female': 'female',
+                    'nan': 'unknown', '': 'unknown'
+                })
+
+            # Fill empty with 'unknown'
+            cleaned = cleaned.replace(['', 'nan', 'none', 'null'], 'unknown')
+
+            df[col] = cleaned.to_numpy()[codes]
+            summary.append((col, original_vals, cleaned.unique().tolist()))
+
+    return df, summary
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES)
+def clean_pipeline(bytes_data):
+    # All deterministic cleaning stages, memoized on the uploaded bytes so
+    # widget-triggered reruns skip straight to rendering. The stages are pure
+    # and left uncached: their inputs are always new when this body runs.
+    report = {}
+    df = downcast_numeric(load_csv(bytes_data))
+    df, report['null_total'] = handle_nulls(df)
+    df, report['dup_count'] = dedupe(df)
+    df, report['const_cols'] = drop_constant(df)
+    df.columns = clean_column_names(df)
+    # Types are settled first so the outlier pass and the heatmap both see
+    # every numeric column, including ones converted from object.
+    df, report['correction_log'] = infer_dtypes(df)
+    df, report['outlier_count'], report['corr'] = detect_outliers(df)
+    report['num_cols'] = report['corr'].columns
+    df, report['category_summary'] = standardize_categorical(df)
+    return df, report
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES)
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES)
+def to_parquet_bytes(df):
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine='pyarrow', compression='snappy', index=False)
+    return buffer.getvalue()